@@ -508,7 +508,7 @@ class H5Chipper(BaseChipper):
         self._band_name = band_name
         super(H5Chipper, self).__init__(data_size, symmetry=symmetry, complex_type=complex_type)
 
-    def _read_raw_fun(self, range1, range2):
+    def _read_raw_fun(self, range1, range2, out=None):
         def reorder(tr):
             if tr[2] > 0:
                 return tr, False
@@ -468,7 +468,7 @@ class ICEYEChipper(BaseChipper):
         self._imaginary_group = imaginary_group
         super(ICEYEChipper, self).__init__(data_size, symmetry=symmetry, complex_type=complex_type)
 
-    def _read_raw_fun(self, range1, range2):
+    def _read_raw_fun(self, range1, range2, out=None):
         def validate_gp(gp, name):
             if not isinstance(gp, h5py.Dataset):
                 raise ValueError(
@@ -467,11 +467,12 @@ def complex_to_int(data):
 
     i16_info = numpy.iinfo(numpy.int16)  # for getting max/min type values
     data_view = data.view(dtype=view_dtype).reshape(new_shape)
-    out = numpy.zeros(new_shape, dtype=numpy.int16)
-    out[:] = numpy.round(numpy.clip(data_view, i16_info.min, i16_info.max))
+    # clip, and then round in place, so the only intermediate is the single clipped array
     # this is nonsense without the clip - gets cast to int64 and then truncated.
     # should we round? Without it, it will be the floor, I believe.
-    return out
+    scratch = numpy.clip(data_view, i16_info.min, i16_info.max)
+    numpy.rint(scratch, out=scratch)
+    return scratch.astype(numpy.int16)
 
 
 def extract_clas(sicd):
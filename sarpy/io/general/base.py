@@ -131,7 +131,7 @@ class BaseChipper(object):
         numpy.ndarray
         """
 
-        data = self._read_raw_fun(range1, range2)
+        data = self._read_for_call(range1, range2)
         data = self._data_to_complex(data)
 
         # make a one band image flat
@@ -158,6 +158,29 @@ class BaseChipper(object):
         range1, range2 = self._slice_to_args(item)
         return self.__call__(range1, range2)
 
+    def read_raw(self, range1, range2, out=None):
+        """
+        Reads the data as stored in the file, before any complex data and symmetry
+        transformations are applied. This is primarily intended for repeated reads
+        of the same size, e.g. a loop over tiles, where providing `out` permits
+        one array to be reused for every read.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+        out : None|numpy.ndarray
+            An array to populate and return. This is only used if it is writeable,
+            and of the shape and data type of the data read, and the chipper supports
+            it. Otherwise a new array is returned.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        return self._read_raw_fun(range1, range2, out=out)
+
     @staticmethod
     def _slice_to_args(item):
         # type: (Union[None, int, slice, tuple]) -> tuple
@@ -257,7 +280,46 @@ class BaseChipper(object):
             data = numpy.swapaxes(data, 1, 0)
         return data
 
-    def _read_raw_fun(self, range1, range2):
+    @staticmethod
+    def _is_usable_out(out, shape, dtype):
+        """
+        Is the given array usable for populating with data of the given shape
+        and data type, as for the `out` argument of :meth:`read_raw`?
+
+        Parameters
+        ----------
+        out : None|numpy.ndarray
+        shape : tuple
+        dtype : str|numpy.dtype|numpy.number
+
+        Returns
+        -------
+        bool
+        """
+
+        return isinstance(out, numpy.ndarray) and out.shape == shape and \
+            out.dtype == numpy.dtype(dtype) and out.flags.writeable
+
+    def _read_for_call(self, range1, range2):
+        """
+        Reads the data to be transformed and returned by :meth:`__call__`. The
+        data is only used as the input for the complex data and symmetry
+        transformations, so an implementation may return a (read-only) view here,
+        where those transformations construct a new array anyway.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        return self._read_raw_fun(range1, range2)
+
+    def _read_raw_fun(self, range1, range2, out=None):
         """
         Reads data as stored in a file, before any complex data and symmetry
         transformations are applied. The one potential exception to the "raw"
@@ -275,6 +337,9 @@ class BaseChipper(object):
             * if (`int`, `int`, `int`) = `start`, `stop`, `step size`
         range2 : None|int|tuple
             same as `range1`, except for the second axis.
+        out : None|numpy.ndarray
+            An array to populate and return, if suitable. Implementations which
+            do not support this may ignore it, and return a new array.
 
         Returns
         -------
@@ -349,7 +414,26 @@ class SubsetChipper(BaseChipper):
         arange2 = _get_range(range2, self.shift2, self._data_size[1])
         return arange1, arange2
 
-    def _read_raw_fun(self, range1, range2):
+    def read_raw(self, range1, range2, out=None):
+        """
+        Reads the data as stored in the file, from the parent chipper. See
+        :meth:`BaseChipper.read_raw`.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+        out : None|numpy.ndarray
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        arange1, arange2 = self._reformat_bounds(range1, range2)
+        return self.parent_chipper.read_raw(arange1, arange2, out=out)
+
+    def _read_raw_fun(self, range1, range2, out=None):
         arange1, arange2 = self._reformat_bounds(range1, range2)
         return self.parent_chipper.__call__(arange1, arange2)
 
@@ -425,31 +509,29 @@ class AggregateChipper(BaseChipper):
         if not (bounds.ndim == 2 and bounds.shape[1] == 4):
             raise ValueError('bounds must be an Nx4 numpy.ndarray, not shape {}'.format(bounds.shape))
 
-        # determine data sizes and sensibility
-        data_sizes = numpy.zeros((bounds.shape[0], 2), dtype=numpy.int64)
-        p_row_start, p_row_end, p_col_start, p_col_end = None, None, None, None
-
-        for i, entry in enumerate(bounds):
-            # Are the order of the entries in bounds sensible?
-            if not (0 <= entry[0] < entry[1] and 0 <= entry[2] < entry[3]):
-                raise ValueError('entry {} of bounds is {}, and cannot be of the form '
-                                 '[row start, row end, column start, column end]'.format(i, entry))
-            # Are the elements of bounds sensible in relative terms?
-            #   Expected to traverse by a specific block of columns until we reach the row limit,
-            #   and then moving on the next segment of columns
-            if i == 0:
-                if entry[0] != 0 or entry[2] != 0:
-                    raise ValueError(
-                        'The bounds must begin at row 0 and column 0. '
-                        'Got initial bounds {}'.format(entry))
-            else:
-                # this block of rows has new column start where previous one ended, or start a new block of rows
-                if not ((p_col_end == entry[2] and p_row_start == entry[0] and p_row_end == entry[1]) or
-                        (p_row_end == entry[0] and entry[2] == 0)):
-                    raise ValueError('The relative order for the chipper elements cannot be determined.')
-            p_row_start, p_row_end, p_col_start, p_col_end = entry
-            # define the data_sizes entry
-            data_sizes[i, :] = (entry[1] - entry[0], entry[3] - entry[2])
+        # Are the order of the entries in bounds sensible?
+        bad = ~((0 <= bounds[:, 0]) & (bounds[:, 0] < bounds[:, 1]) &
+                (0 <= bounds[:, 2]) & (bounds[:, 2] < bounds[:, 3]))
+        if numpy.any(bad):
+            i = int_func(numpy.nonzero(bad)[0][0])
+            raise ValueError('entry {} of bounds is {}, and cannot be of the form '
+                             '[row start, row end, column start, column end]'.format(i, bounds[i]))
+        if bounds.shape[0] > 0 and (bounds[0, 0] != 0 or bounds[0, 2] != 0):
+            raise ValueError(
+                'The bounds must begin at row 0 and column 0. '
+                'Got initial bounds {}'.format(bounds[0]))
+        # Are the elements of bounds sensible in relative terms?
+        #   Expected to traverse by a specific block of columns until we reach the row limit,
+        #   and then moving on the next segment of columns
+        prev, cur = bounds[:-1], bounds[1:]
+        # this block of rows has new column start where previous one ended, or start a new block of rows
+        ordered = ((prev[:, 3] == cur[:, 2]) & (prev[:, 0] == cur[:, 0]) & (prev[:, 1] == cur[:, 1])) | \
+            ((prev[:, 1] == cur[:, 0]) & (cur[:, 2] == 0))
+        if not numpy.all(ordered):
+            raise ValueError('The relative order for the chipper elements cannot be determined.')
+        # define the data_sizes
+        data_sizes = numpy.column_stack(
+            [bounds[:, 1] - bounds[:, 0], bounds[:, 3] - bounds[:, 2]]).astype(numpy.int64)
         return data_sizes
 
     def _subset(self, rng, start_ind, stop_ind):
@@ -490,15 +572,24 @@ class AggregateChipper(BaseChipper):
             ind2 = rng[0] + mult2*rng[2]
         return (ind1-start_ind, ind2-start_ind, rng[2]), (mult1, mult2)
 
-    def _read_raw_fun(self, range1, range2):
-        range1, range2 = self._reorder_arguments(range1, range2)
-        rows_size = int_func((range1[1]-range1[0])/range1[2])
-        cols_size = int_func((range2[1]-range2[0])/range2[2])
+    def _get_child_reads(self, range1, range2):
+        """
+        Determines the reads from the child chippers required to populate the
+        given (validated) ranges.
 
-        if self._bands_out == 1:
-            out = numpy.empty((rows_size, cols_size), dtype=self._dtype)
-        else:
-            out = numpy.empty((rows_size, cols_size, self._bands_out), dtype=self._dtype)
+        Parameters
+        ----------
+        range1 : Tuple[int, int, int]
+        range2 : Tuple[int, int, int]
+
+        Returns
+        -------
+        List[Tuple[tuple, BaseChipper, tuple]]
+            Entries of the form `(out_item, child_chipper, child_item)`, so that
+            `out[out_item] = child_chipper[child_item]`.
+        """
+
+        reads = []
         for entry, child_chipper in zip(self._bounds, self._child_chippers):
             row_start, row_end, col_start, col_end = entry
             # find row overlap for chipper - it's rectangular
@@ -511,12 +602,130 @@ class AggregateChipper(BaseChipper):
             if crange2 is None:
                 continue  # there is no column overlap for this chipper
 
-            if self._bands_out == 1:
-                out[cinds1[0]:cinds1[1], cinds2[0]:cinds2[1]] = \
-                    child_chipper[crange1[0]:crange1[1]:crange1[2], crange2[0]:crange2[1]:crange2[2]]
-            else:
-                out[cinds1[0]:cinds1[1], cinds2[0]:cinds2[1], :] = \
-                    child_chipper[crange1[0]:crange1[1]:crange1[2], crange2[0]:crange2[1]:crange2[2]]
+            reads.append(
+                ((slice(cinds1[0], cinds1[1]), slice(cinds2[0], cinds2[1])),
+                 child_chipper,
+                 (slice(crange1[0], crange1[1], crange1[2]), slice(crange2[0], crange2[1], crange2[2]))))
+        return reads
+
+    @staticmethod
+    def _read_child(child_chipper, child_item, raw=False):
+        """
+        Performs the given child chipper read.
+
+        Parameters
+        ----------
+        child_chipper : BaseChipper
+        child_item : tuple
+            The slice arguments, as returned by :meth:`_get_child_reads`.
+        raw : bool
+            Read the data as stored in the file, using :meth:`BaseChipper.read_raw`?
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        if raw:
+            return child_chipper.read_raw(*child_chipper._slice_to_args(child_item))
+        return child_chipper[child_item]
+
+    def _read_children(self, out, reads, raw=False):
+        """
+        Populates the output array by performing the given child chipper reads.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+        reads : List[Tuple[tuple, BaseChipper, tuple]]
+            As returned by :meth:`_get_child_reads`.
+        raw : bool
+            Read the data as stored in the file, using :meth:`BaseChipper.read_raw`?
+
+        Returns
+        -------
+        None
+        """
+
+        for out_item, child_chipper, child_item in reads:
+            out[out_item] = self._read_child(child_chipper, child_item, raw=raw)
+
+    def _get_output_shape(self, range1, range2):
+        rows_size = int_func((range1[1]-range1[0])/range1[2])
+        cols_size = int_func((range2[1]-range2[0])/range2[2])
+        return rows_size, cols_size
+
+    def read_raw(self, range1, range2, out=None):
+        """
+        Reads the data as stored in the file(s), assembled from the raw data of
+        the child chippers. See :meth:`BaseChipper.read_raw`. This requires that
+        no child chipper applies a symmetry transformation, since the raw data of
+        the children is otherwise not arranged according to the bounds.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+        out : None|numpy.ndarray
+            An array to populate and return, permitting one array to be reused
+            across repeated reads. This is only used if it is writeable, and of
+            the shape and data type of the raw data read, otherwise a new array
+            is returned.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        for i, child_chipper in enumerate(self._child_chippers):
+            if any(child_chipper.symmetry):
+                raise ValueError(
+                    'Child chipper at index {} has symmetry {}, so the raw data can not be '
+                    'assembled.'.format(i, child_chipper.symmetry))
+
+        range1, range2 = self._reorder_arguments(range1, range2)
+        shape = self._get_output_shape(range1, range2)
+        reads = self._get_child_reads(range1, range2)
+        if len(reads) == 0:
+            return numpy.empty(shape, dtype=self._dtype)
+        # the raw bands and data type are determined by the first child read
+        out_item, child_chipper, child_item = reads[0]
+        data = self._read_child(child_chipper, child_item, raw=True)
+        shape = shape + data.shape[2:]
+        if not self._is_usable_out(out, shape, data.dtype):
+            out = numpy.empty(shape, dtype=data.dtype)
+        out[out_item] = data
+        self._read_children(out, reads[1:], raw=True)
+        return out
+
+    def _read_raw_fun(self, range1, range2, out=None):
+        """
+        Reads the data from the child chippers. See :meth:`BaseChipper._read_raw_fun`.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+        out : None|numpy.ndarray
+            An array to populate and return, permitting one array to be reused
+            across repeated reads. This is only used if it is writeable, and of
+            the shape and data type of the data read, otherwise a new array is returned.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        range1, range2 = self._reorder_arguments(range1, range2)
+        rows_size, cols_size = self._get_output_shape(range1, range2)
+
+        if self._bands_out == 1:
+            shape = (rows_size, cols_size)
+        else:
+            shape = (rows_size, cols_size, self._bands_out)
+        if not self._is_usable_out(out, shape, self._dtype):
+            out = numpy.empty(shape, dtype=self._dtype)
+        self._read_children(out, self._get_child_reads(range1, range2))
         return out
 
 
@@ -841,6 +1050,39 @@ class BaseReader(object):
         else:
             return self._chipper.__getitem__(item)
 
+    def read_raw(self, dim1range, dim2range, index=None, out=None):
+        """
+        Read the given section of data as stored in the file, before any complex
+        data and symmetry transformations are applied. See :meth:`BaseChipper.read_raw`.
+
+        Parameters
+        ----------
+        dim1range : None|int|Tuple[int, int]|Tuple[int, int, int]
+        dim2range : None|int|Tuple[int, int]|Tuple[int, int, int]
+        index : int|None
+            Relative to which sicd/chipper, and only used in the event of multiple
+            sicd/chippers. Defaults to `0`, if not provided.
+        out : None|numpy.ndarray
+            An array to populate and return, permitting one array to be reused
+            across repeated reads, where suitable.
+
+        Returns
+        -------
+        numpy.ndarray
+
+        Examples
+        --------
+        Reading the raw data tile by tile into a single array
+        :code:`out = reader.read_raw((0, 256, 1), (0, 256, 1))`
+        :code:`out = reader.read_raw((256, 512, 1), (0, 256, 1), out=out)`
+        """
+
+        if isinstance(self._chipper, tuple):
+            index = self._validate_index(index)
+            return self._chipper[index].read_raw(dim1range, dim2range, out=out)
+        else:
+            return self._chipper.read_raw(dim1range, dim2range, out=out)
+
     def read_chip(self, dim1range, dim2range, index=None):
         """
         Read the given section of data as an array. Note that
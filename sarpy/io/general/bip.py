@@ -6,6 +6,12 @@ data stored in *Band Interleaved By Pixel (BIP)* format.
 
 import logging
 import os
+import stat
+import errno
+import mmap
+import threading
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 
 import numpy
 
@@ -17,17 +23,119 @@ __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
 
+def _get_iov_max():
+    """
+    Gets the maximum number of buffers which may be provided to a single
+    scatter/gather (i.e. `readv` or `writev` type) system call.
+
+    Returns
+    -------
+    int
+    """
+
+    try:
+        value = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        value = -1
+    # 16 is the minimum value permitted by POSIX
+    return value if value > 0 else 16
+
+
+_IOV_MAX = _get_iov_max()
+# memory map access advice, only available for python 3.8+ & suitable platforms
+_MADV_RANDOM = getattr(mmap, 'MADV_RANDOM', None)
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+_MADV_WILLNEED = getattr(mmap, 'MADV_WILLNEED', None)
+
+
+_THREAD_POOL = None
+_THREAD_POOL_LOCK = threading.Lock()
+
+
+def _get_thread_pool():
+    """
+    Gets the thread pool for concurrent reading, which is shared by all
+    chippers and constructed on first use.
+
+    Returns
+    -------
+    None|ThreadPool
+        `None` if only a single thread would be used.
+    """
+
+    global _THREAD_POOL
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None:
+            try:
+                workers = cpu_count()
+            except NotImplementedError:
+                workers = 1
+            if workers < 2:
+                return None
+            _THREAD_POOL = ThreadPool(processes=workers)
+        return _THREAD_POOL
+
+
+def _validate_file(file_name, stat_result=None):
+    """
+    Validates that the given path is a regular file, using a single `os.stat`.
+    Read access is not checked here, since that is only reliably determined by
+    actually opening the file.
+
+    Parameters
+    ----------
+    file_name : str
+    stat_result : None|os.stat_result
+        The result of `os.stat` for this file, if already determined.
+
+    Returns
+    -------
+    os.stat_result
+    """
+
+    if stat_result is None:
+        try:
+            stat_result = os.stat(file_name)
+        except OSError:
+            stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        raise IOError('Path {} either does not exists, or is not a file.'.format(file_name))
+    return stat_result
+
+
+def _is_access_error(err):
+    """
+    Is the given error the result of lacking permission to access the file?
+
+    Parameters
+    ----------
+    err : Exception
+
+    Returns
+    -------
+    bool
+    """
+
+    return getattr(err, 'errno', None) in (errno.EACCES, errno.EPERM)
+
+
 class BIPChipper(BaseChipper):
     """
     Band interleaved format file chipper
     """
 
     __slots__ = (
-        '_file_name', '_data_type', '_data_offset', '_shape', '_bands', '_memory_map', '_fid')
+        '_file_name', '_data_type', '_data_offset', '_shape', '_bands', '_itemsize',
+        '_element_size', '_row_stride', '_memory_map', '_memory_map_start', '_memory_map_advice',
+        '_fid', '_use_memmap')
+    _SEQUENTIAL_READ_BYTES = 4*1024*1024  # reads larger than this use sequential memory map access
+    _TILED_READ_BYTES = 16*1024*1024  # memory map reads larger than this are copied in tiles
+    _TILE_BYTES = 2*1024*1024  # the approximate size of each such tile
 
     def __init__(self, file_name, data_type, data_size,
                  symmetry=(False, False, False), complex_type=False,
-                 data_offset=0, bands_ip=1):
+                 data_offset=0, bands_ip=1, use_memmap=None, shared_memory_map=None, populate=False,
+                 stat_result=None):
         """
 
         Parameters
@@ -51,6 +159,24 @@ class BIPChipper(BaseChipper):
             byte offset from the start of the file at which the data actually starts
         bands_ip : int
             number of bands - really intended for complex data
+        use_memmap : None|bool
+            Should reading use a memory map? If `None`, then a memory map is used
+            unless the requested entries are so sparse that it would mostly fault
+            in pages which are discarded, see :meth:`_should_use_memmap`. If
+            `False`, then the file is always read manually. A memory map can not
+            be used for large files in 32-bit python, regardless of this setting.
+        shared_memory_map : None|numpy.memmap
+            A uint8 memory map of the entire file, of which the memory map for
+            this chipper will be a view. This permits many chippers for the same
+            file to share a single memory map.
+        populate : bool
+            Should the memory map be populated up front? This is intended for
+            reading (most of) the data once, where faulting in the pages one by one
+            is slower than a single large read. Where possible, this uses `MAP_POPULATE`,
+            and otherwise advises the kernel that the data will be needed.
+        stat_result : None|os.stat_result
+            The result of `os.stat` for the file, if already determined. This
+            permits many chippers for the same file to avoid repeating it.
         """
 
         super(BIPChipper, self).__init__(data_size, symmetry=symmetry, complex_type=complex_type)
@@ -63,84 +189,415 @@ class BIPChipper(BaseChipper):
         self._data_type = data_type
         self._bands = bands
         self._shape = (int_func(data_size[0]), int_func(data_size[1]), self._bands)
+        # the byte sizes of a band entry, a (multi-band) element, and a whole (real) row
+        self._itemsize = int_func(numpy.dtype(data_type).itemsize)
+        self._element_size = self._itemsize*self._bands
+        self._row_stride = self._element_size*self._shape[1]
 
-        if not os.path.isfile(file_name):
-            raise IOError('Path {} either does not exists, or is not a file.'.format(file_name))
-        if not os.access(file_name, os.R_OK):
-            raise IOError('User does not appear to have read access for file {}.'.format(file_name))
+        _validate_file(file_name, stat_result=stat_result)
         self._file_name = file_name
 
         self._memory_map = None
+        self._memory_map_start = None
+        self._memory_map_advice = None
         self._fid = None
+        self._use_memmap = None if use_memmap is None else bool(use_memmap)
+        if self._use_memmap is False:
+            self._fid = self._open_file()
+            return
+
+        if shared_memory_map is not None:
+            data_end = self._data_offset + self._row_stride*self._shape[0]
+            self._memory_map = shared_memory_map[self._data_offset:data_end].view(
+                data_type).reshape(self._shape)  # type: numpy.memmap
+            self._memory_map_start = self._data_offset
+            self._advise_memory_map(_MADV_WILLNEED if populate else _MADV_RANDOM)
+            return
+
         try:
-            self._memory_map = numpy.memmap(self._file_name,
-                                            dtype=data_type,
-                                            mode='r',
-                                            offset=data_offset,
-                                            shape=self._shape)  # type: numpy.memmap
-        except (OverflowError, OSError):
+            # the memory map begins at an allocation granularity boundary before the data offset
+            self._memory_map_start = self._data_offset % mmap.ALLOCATIONGRANULARITY
+            if populate and hasattr(mmap, 'MAP_POPULATE'):
+                self._memory_map = self._create_populated_memory_map()
+            else:
+                self._memory_map = numpy.memmap(self._file_name,
+                                                dtype=data_type,
+                                                mode='r',
+                                                offset=data_offset,
+                                                shape=self._shape)  # type: numpy.memmap
+                # chips are generally small and scattered, so avoid the default readahead
+                self._advise_memory_map(_MADV_WILLNEED if populate else _MADV_RANDOM)
+        except (OverflowError, IOError, OSError) as err:
+            if _is_access_error(err):
+                raise IOError('User does not appear to have read access for file {}.'.format(file_name))
             # if 32-bit python, then we'll fail for any file larger than 2GB
             # we fall-back to a slower version of reading manually
-            self._fid = open(self._file_name, mode='rb')
+            self._fid = self._open_file()
             logging.warning(
                 'Falling back to reading file {} manually (instead of using mem-map). This has almost '
                 'certainly occurred because you are 32-bit python to try to read (portions of) a file '
                 'which is larger than 2GB.'.format(self._file_name))
 
     def __del__(self):
-        if hasattr(self, '_fid') and self._fid is not None and \
-                hasattr(self._fid, 'closed') and not self._fid.closed:
-            self._fid.close()
+        if hasattr(self, '_fid') and self._fid is not None:
+            os.close(self._fid)
+            self._fid = None
+
+    def _open_file(self):
+        """
+        Opens the file for manual reading. This is a raw file descriptor, since
+        all reading is positional and does not rely on (or change) the file position.
+
+        Returns
+        -------
+        int
+        """
+
+        try:
+            return os.open(self._file_name, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except OSError as err:
+            if _is_access_error(err):
+                raise IOError('User does not appear to have read access for file {}.'.format(self._file_name))
+            raise
+
+    def _create_populated_memory_map(self):
+        """
+        Creates the memory map for the data using `MAP_POPULATE`, so that the
+        pages are read and mapped in a single system call.
+
+        Returns
+        -------
+        numpy.memmap
+        """
+
+        mmap_offset = self._data_offset - self._memory_map_start
+        fid = self._open_file()
+        try:
+            the_mmap = mmap.mmap(
+                fid, self._memory_map_start + self._row_stride*self._shape[0],
+                flags=mmap.MAP_SHARED | mmap.MAP_POPULATE, prot=mmap.PROT_READ, offset=mmap_offset)
+        finally:
+            # the memory map holds its own reference to the file
+            os.close(fid)
+        memory_map = numpy.frombuffer(
+            the_mmap, dtype=self._data_type, count=self._shape[0]*self._shape[1]*self._bands,
+            offset=self._memory_map_start).reshape(self._shape).view(numpy.memmap)
+        # NB: this is how numpy.memmap tracks the underlying mmap, for slices as well
+        memory_map._mmap = the_mmap
+        return memory_map
+
+    def _advise_memory_map(self, advice):
+        """
+        Advise the kernel of the expected access pattern for the memory map. This
+        does nothing if the advice is not supported, or is the present advice.
+
+        Parameters
+        ----------
+        advice : None|int
+            One of the `mmap.MADV_*` constants, which may not be defined.
+
+        Returns
+        -------
+        None
+        """
+
+        if advice is None or advice == self._memory_map_advice:
+            return
+        the_mmap = getattr(self._memory_map, '_mmap', None)
+        if the_mmap is None or not hasattr(the_mmap, 'madvise'):
+            return
+        # only advise for the data of this chipper, since the memory map may be shared
+        begin = self._memory_map_start - self._memory_map_start % mmap.PAGESIZE
+        end = self._memory_map_start + self._memory_map.nbytes
+        try:
+            the_mmap.madvise(advice, begin, end - begin)
+        except (OSError, ValueError):
+            return
+        self._memory_map_advice = advice
+
+    def _read_for_call(self, range1, range2):
+        if self._complex_type is True and numpy.dtype(self._data_type).kind != 'c':
+            # the complex data conversion constructs a new array, so a copy of the raw
+            #   data is redundant - convert directly from the memory map instead
+            return self._read_raw_fun(range1, range2, convert=self._data_to_complex)
+        return self._read_raw_fun(range1, range2)
+
+    def _read_raw_fun(self, range1, range2, copy=True, out=None, convert=None):
+        """
+        Reads data as stored in the file. See :meth:`BaseChipper._read_raw_fun`.
+
+        Parameters
+        ----------
+        range1 : None|int|tuple
+        range2 : None|int|tuple
+        copy : bool
+            Should data read from the memory map be copied, rather than returned
+            as a (read-only) view of the memory map? This is ignored if `out` is used.
+        out : None|numpy.ndarray
+            An array to populate and return, permitting one array to be reused
+            across repeated reads. This is only used if it is writeable, and of
+            the shape `(rows, cols, bands)` and data type of the data read,
+            otherwise a new array is returned.
+        convert : None|callable
+            A transformation, constructing a new array, to apply to the data read
+            in place of any copy. For large memory map reads, this is applied in
+            prefetched tiles. This is ignored if `out` is used.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
 
-    def _read_raw_fun(self, range1, range2):
         t_range1, t_range2 = self._reorder_arguments(range1, range2)
-        if self._memory_map is not None:
-            return self._read_memory_map(t_range1, t_range2)
-        elif self._fid is not None:
-            return self._read_file(t_range1, t_range2)
-
-    def _read_memory_map(self, range1, range2):
-        if (range1[1] == -1 and range1[2] < 0) and (range2[1] == -1 and range2[2] < 0):
-            out = numpy.array(self._memory_map[range1[0]::range1[2], range2[0]::range2[2]],
-                              dtype=self._data_type)
-        elif range1[1] == -1 and range1[2] < 0:
-            out = numpy.array(self._memory_map[range1[0]::range1[2], range2[0]:range2[1]:range2[2]],
-                              dtype=self._data_type)
-        elif range2[1] == -1 and range2[2] < 0:
-            out = numpy.array(self._memory_map[range1[0]:range1[1]:range1[2], range2[0]::range2[2]],
-                              dtype=self._data_type)
-        else:
-            out = numpy.array(self._memory_map[range1[0]:range1[1]:range1[2], range2[0]:range2[1]:range2[2]],
-                              dtype=self._data_type)
-        return out
+        if self._memory_map is not None and (
+                self._use_memmap or self._should_use_memmap(
+                    t_range1, t_range2, self._shape, self._itemsize)):
+            # large contiguous reads benefit from aggressive readahead, anything else does not
+            read_bytes = (t_range1[1] - t_range1[0])*(t_range2[1] - t_range2[0])*self._element_size
+            if t_range1[2] == 1 and t_range2[2] == 1 and read_bytes > self._SEQUENTIAL_READ_BYTES:
+                self._advise_memory_map(_MADV_SEQUENTIAL)
+            else:
+                self._advise_memory_map(_MADV_RANDOM)
+            return self._read_memory_map(t_range1, t_range2, copy=copy, out=out, convert=convert)
+
+        if self._fid is None:
+            self._fid = self._open_file()
+        data = self._read_file(t_range1, t_range2, out=out)
+        if convert is None or data is out:
+            return data
+        return convert(data)
+
+    @classmethod
+    def _should_use_memmap(cls, range1, range2, shape, itemsize):
+        """
+        Determines whether the memory map should be used for reading the given
+        ranges. The memory map faults in whole pages, so reading manually is
+        preferable when rows are skipped by the row step, the gap between
+        consecutive requested rows is more than a page, and each row has less
+        than a page of requested data. Reads without skipped rows always use
+        the memory map.
+
+        Parameters
+        ----------
+        range1 : Tuple[int, int, int]
+        range2 : Tuple[int, int, int]
+        shape : Tuple[int, int, int]
+            The (rows, columns, bands) shape of the data in the file.
+        itemsize : int
+            The size in bytes of a single band entry.
+
+        Returns
+        -------
+        bool
+        """
+
+        row_step = abs(range1[2])
+        if row_step == 1:
+            return True
+        element_size = itemsize*shape[2]
+        # NB: columns which are sparse in this sense are still better served by the
+        #   memory map, since the manual reading covers the full span of columns
+        row_bytes = abs(range2[1] - range2[0])*element_size
+        gap_bytes = row_step*shape[1]*element_size - row_bytes
+        return not (gap_bytes > mmap.PAGESIZE and row_bytes < mmap.PAGESIZE)
+
+    def _read_memory_map(self, range1, range2, copy=True, out=None, convert=None):
+        # NB: a stop of -1 with negative step means read through the first entry
+        data = self._memory_map[
+            slice(range1[0], None if (range1[1] == -1 and range1[2] < 0) else range1[1], range1[2]),
+            slice(range2[0], None if (range2[1] == -1 and range2[2] < 0) else range2[1], range2[2])]
+        if self._is_usable_out(out, data.shape, self._data_type):
+            numpy.copyto(out, data)
+            return out
+        if abs(range1[2]) == 1 and data.nbytes > self._TILED_READ_BYTES:
+            return self._tiled_copy(data, range1, range2, convert=convert)
+        if convert is not None:
+            return convert(data)
+        # the memory map is already of the data type, so only copy when requested
+        if not copy:
+            return numpy.asarray(data)
+        return numpy.array(data)
+
+    def _tiled_copy(self, data, range1, range2, convert=None):
+        """
+        Copies the given memory map slice in tiles of rows, prefetching the pages
+        of the next tile while copying the current one. This overlaps the page
+        fault latency with the copying. This is skipped when the requested columns
+        span less than half of each row, since the prefetch would then mostly
+        read pages which are not needed.
 
-    def _read_file(self, range1, range2):
-        def get_row_location(rr, cc):
-            return self._data_offset + \
-                   rr*stride + \
-                   cc*element_size
+        Parameters
+        ----------
+        data : numpy.memmap
+            The slice of the memory map.
+        range1 : Tuple[int, int, int]
+            The row range for the slice, with step +/-1.
+        range2 : Tuple[int, int, int]
+            The column range for the slice.
+        convert : None|callable
+            A transformation to apply to each tile, in place of the copy.
 
-        # we have to manually map out the stride and all that for the array ourselves
-        element_size = int_func(numpy.dtype(self._data_type).itemsize*self._bands)
-        stride = element_size*int_func(self._shape[0])  # how much to skip a whole (real) row?
-        entries_per_row = abs(range1[1] - range1[0])  # not including the stride, if not +/-1
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        def fetch(the_data):
+            return numpy.array(the_data) if convert is None else convert(the_data)
+
+        the_mmap = getattr(self._memory_map, '_mmap', None)
+        if _MADV_WILLNEED is None or the_mmap is None or not hasattr(the_mmap, 'madvise'):
+            return fetch(data)
+        # the byte span of the requested columns within each row
+        columns = sorted((range2[0], range2[0] + range2[2]*(data.shape[1] - 1)))
+        column_begin = columns[0]*self._element_size
+        column_end = (columns[1] + 1)*self._element_size
+        if 2*(column_end - column_begin) < self._row_stride:
+            return fetch(data)
+
+        rows = data.shape[0]
+        out = None
+        # the tiles are sized by the file rows, which is what will be prefetched
+        tile_rows = max(1, self._TILE_BYTES//self._row_stride)
+        data_start = self._memory_map_start
+
+        def prefetch(start):
+            if start >= rows:
+                return
+            stop = min(start + tile_rows, rows)
+            file_rows = sorted((range1[0] + range1[2]*start, range1[0] + range1[2]*(stop - 1)))
+            begin = data_start + file_rows[0]*self._row_stride + column_begin
+            begin -= begin % mmap.PAGESIZE
+            end = data_start + file_rows[1]*self._row_stride + column_end
+            try:
+                the_mmap.madvise(_MADV_WILLNEED, begin, end - begin)
+            except (OSError, ValueError):
+                pass
+
+        prefetch(0)
+        for start in range(0, rows, tile_rows):
+            prefetch(start + tile_rows)
+            tile = data[start:start + tile_rows]
+            if convert is not None:
+                tile = convert(tile)
+            if out is None:
+                out = numpy.empty((rows, ) + tile.shape[1:], dtype=tile.dtype)
+            out[start:start + tile_rows] = tile
+        return out
+
+    def _read_file(self, range1, range2, out=None):
         # let's determine the specific row/column arrays that we are going to read
-        dim1array = numpy.arange(range1)
-        dim2array = numpy.arange(range2)
-        # allocate our output array
-        out = numpy.empty((len(dim1array), len(dim2array), self._bands), dtype=self._data_type)
+        #   NB: int64, since the file offsets are expected to exceed 2GB in 32-bit python
+        dim1array = numpy.arange(range1[0], range1[1], range1[2], dtype=numpy.int64)
+        dim2array = numpy.arange(range2[0], range2[1], range2[2], dtype=numpy.int64)
+        shape = (dim1array.size, dim2array.size, self._bands)
+        use_out = self._is_usable_out(out, shape, self._data_type)
+        if dim1array.size == 0 or dim2array.size == 0:
+            return out if use_out else numpy.empty(shape, dtype=self._data_type)
+
         # determine the first column reading location (may be reading cols backwards)
         col_begin = dim2array[0] if range2[2] > 0 else dim2array[-1]
+        # including the entries skipped by the stride, if not +/-1
+        entries_per_row = int_func(abs(dim2array[-1] - dim2array[0])) + 1
+        # read the rows in the order they are stored in the file
+        rows = dim1array if range1[2] > 0 else dim1array[::-1]
+        offsets = self._data_offset + rows*self._row_stride + col_begin*self._element_size
+        if use_out and range1[2] > 0 and range2[2] == 1 and out.flags.c_contiguous:
+            # we can read directly into out
+            self._read_rows(offsets, out)
+            return out
+
+        data = numpy.empty((rows.size, entries_per_row, self._bands), dtype=self._data_type)
+        self._read_rows(offsets, data)
+        if range1[2] < 0:
+            data = data[::-1, :, :]
+        # note that we purposely read without considering skipping elements, which
+        #   is factored in (along with any potential order reversal) here
+        data = data[:, ::range2[2], :]
+        if use_out:
+            numpy.copyto(out, data)
+            return out
+        return data
+
+    def _read_rows(self, offsets, out):
+        """
+        Reads the contiguous block of bytes for each row of `out` from the file,
+        starting at the corresponding file offset.
 
-        for i, row in enumerate(dim1array):
-            # go to the appropriate point in the file for (row/col)
-            self._fid.seek(get_row_location(row, col_begin))
-            # interpret this of line as numpy.ndarray - inherently flat array
-            line = numpy.fromfile(self._fid, self._data_type, entries_per_row*self._bands)
-            # note that we purposely read without considering skipping elements, which
-            #   is factored in (along with any potential order reversal) below
-            out[i, :, :] = line[::range2[2]]
-        return out
+        Parameters
+        ----------
+        offsets : numpy.ndarray
+            The increasing and evenly spaced file offsets for the start of each row.
+        out : numpy.ndarray
+            The C-contiguous array to be populated.
+
+        Returns
+        -------
+        None
+        """
+
+        # the flat bytes view of out, and (cheap) memoryview slices for each row
+        flat = memoryview(out.reshape((-1, )).view(numpy.uint8))
+        row_bytes = len(flat)//out.shape[0]
+        rows = [flat[i:i + row_bytes] for i in range(0, len(flat), row_bytes)]
+        offsets = offsets.tolist()
+        # the number of bytes between the end of one row and the start of the next
+        gap = offsets[1] - offsets[0] - row_bytes if len(offsets) > 1 else 0
+
+        if gap == 0:
+            # the rows are contiguous in the file, so read them all at once
+            self._read_into(offsets[0], flat)
+        elif hasattr(os, 'preadv') and gap <= max(row_bytes, mmap.PAGESIZE):
+            # read many rows in a single system call, discarding the (modest) gap between them
+            discard = memoryview(bytearray(gap))
+            rows_per_call = max(1, _IOV_MAX//2)
+            for start in range(0, len(rows), rows_per_call):
+                stop = min(start + rows_per_call, len(rows))
+                # interleave the row buffers with the discard buffer
+                buffers = [discard, ]*(2*(stop - start) - 1)
+                buffers[::2] = rows[start:stop]
+                expected = (stop - start)*row_bytes + (stop - start - 1)*gap
+                if os.preadv(self._fid, buffers, offsets[start]) != expected:
+                    raise IOError(
+                        'Failed reading the expected number of bytes from file {}'.format(self._file_name))
+        else:
+            for offset, row in zip(offsets, rows):
+                self._read_into(offset, row)
+
+    def _read_into(self, offset, buffer):
+        """
+        Reads from the file, starting at the given offset, to fill the given buffer.
+
+        Parameters
+        ----------
+        offset : int
+        buffer : memoryview
+            The one-dimensional bytes view to be populated.
+
+        Returns
+        -------
+        None
+        """
+
+        start = 0
+        while start < len(buffer):
+            # NB: a single read may return fewer bytes than requested, e.g. more than 2GB
+            if hasattr(os, 'preadv'):
+                count = os.preadv(self._fid, [buffer[start:], ], offset + start)
+            elif hasattr(os, 'pread'):
+                data = os.pread(self._fid, len(buffer) - start, offset + start)
+                count = len(data)
+                buffer[start:start + count] = data
+            else:
+                # NB: this relies on the file position, so is not thread safe
+                os.lseek(self._fid, offset + start, os.SEEK_SET)
+                data = os.read(self._fid, len(buffer) - start)
+                count = len(data)
+                buffer[start:start + count] = data
+            if count == 0:
+                raise IOError(
+                    'Failed reading the expected number of bytes from file {}'.format(self._file_name))
+            start += count
 
 
 class MultiSegmentChipper(AggregateChipper):
@@ -150,6 +607,7 @@ class MultiSegmentChipper(AggregateChipper):
     """
 
     __slots__ = ('_file_name', )
+    _THREADED_READ_BYTES = 4*1024*1024  # reads larger than this read the child chippers concurrently
 
     def __init__(self, file_name, bounds, data_offsets, data_type,
                  symmetry=None, complex_type=False, bands_ip=1, data_type_out=None, bands_out=1):
@@ -176,26 +634,10 @@ class MultiSegmentChipper(AggregateChipper):
         """
 
         self._file_name = file_name
-        self._validate_bounds(bounds)
+        # a single check of the file, shared by all of the child chippers
+        stat_result = _validate_file(file_name)
         # determine data sizes and sensibility
-        data_sizes = numpy.zeros((bounds.shape[0], 2), dtype=numpy.int64)
-        p_row_start, p_row_end, p_col_start, p_col_end = None, None, None, None
-        for i, entry in enumerate(bounds):
-            # Are the order of the entries in bounds sensible?
-            if not (0 <= entry[0] < entry[1] and 0 <= entry[2] < entry[3]):
-                raise ValueError('entry {} of bounds is {}, and cannot be of the form '
-                                 '[row start, row end, column start, column end]'.format(i, entry))
-
-            # Are the elements of bounds sensible in relative terms?
-            #   we must traverse by a specific block of rows until we reach the column limit,
-            #   and then moving on the next segment of rows
-            if i > 0:
-                if not ((p_col_end == entry[2] and p_row_start == entry[0] and p_row_end == entry[1]) or
-                        (p_row_end == entry[0] and entry[2] == 0)):
-                    raise ValueError('The relative order for the chipper elements cannot be determined.')
-            p_row_start, p_row_end, p_col_start, p_col_end = entry
-            # define the data_sizes entry
-            data_sizes[i, :] = (entry[1] - entry[0], entry[3] - entry[2])
+        data_sizes = self._validate_bounds(bounds)
 
         # validate data offsets
         if not isinstance(data_offsets, numpy.ndarray):
@@ -215,13 +657,37 @@ class MultiSegmentChipper(AggregateChipper):
                 data_type_out = data_type
             else:
                 data_type_out = 'complex64'
+        # a single memory map of the file, shared by all of the child chippers
+        try:
+            shared_memory_map = numpy.memmap(file_name, dtype=numpy.uint8, mode='r')
+        except (OverflowError, IOError, OSError) as err:
+            if _is_access_error(err):
+                raise IOError('User does not appear to have read access for file {}.'.format(file_name))
+            # if 32-bit python and the file is larger than 2GB - each child
+            #   chipper will try to memory map its own segment
+            shared_memory_map = None
         child_chippers = tuple(
             BIPChipper(file_name, data_type, img_siz, symmetry=symmetry,
                        complex_type=complex_type, data_offset=img_off,
-                       bands_ip=bands_ip)
+                       bands_ip=bands_ip, shared_memory_map=shared_memory_map,
+                       stat_result=stat_result)
             for img_siz, img_off in zip(data_sizes, data_offsets))
         super(MultiSegmentChipper, self).__init__(bounds, data_type_out, child_chippers, bands_out=bands_out)
 
+    def _read_children(self, out, reads, raw=False):
+        # the reads from separate child chippers are independent, and the GIL is
+        #   released while waiting on the file, so overlap them for large reads
+        pool = _get_thread_pool() if len(reads) > 1 and out.nbytes > self._THREADED_READ_BYTES else None
+        if pool is None:
+            super(MultiSegmentChipper, self)._read_children(out, reads, raw=raw)
+            return
+
+        def read(entry):
+            out_item, child_chipper, child_item = entry
+            out[out_item] = self._read_child(child_chipper, child_item, raw=raw)
+
+        pool.map(read, reads)
+
 
 class BIPWriter(AbstractWriter):
     """
@@ -232,7 +698,7 @@ class BIPWriter(AbstractWriter):
 
     __slots__ = (
         '_data_size', '_data_type', '_complex_type', '_data_offset',
-        '_shape', '_memory_map', '_fid')
+        '_shape', '_element_size', '_row_stride', '_memory_map', '_fid')
 
     def __init__(self, file_name, data_size, data_type, complex_type, data_offset=0):
         """
@@ -301,6 +767,11 @@ class BIPWriter(AbstractWriter):
             self._shape = self._data_size
         else:
             self._shape = (self._data_size[0], self._data_size[1], 2)
+        # the byte sizes of a (multi-band) element, and a whole (real) row
+        self._element_size = int_func(self._data_type.itemsize)
+        if len(self._shape) == 3:
+            self._element_size *= int_func(self._shape[2])
+        self._row_stride = self._element_size*int_func(self._data_size[1])
 
         self._memory_map = None
         self._fid = None
@@ -313,7 +784,7 @@ class BIPWriter(AbstractWriter):
         except (OverflowError, OSError):
             # if 32-bit python, then we'll fail for any file larger than 2GB
             # we fall-back to a slower version of reading manually
-            self._fid = open(self._file_name, mode='r+b')
+            self._fid = os.open(self._file_name, os.O_RDWR | getattr(os, 'O_BINARY', 0))
             logging.warning(
                 'Falling back to writing file {} manually (instead of using mem-map). This has almost '
                 'certainly occurred because you are 32-bit python to try to read (portions of) a file '
@@ -343,16 +814,16 @@ class BIPWriter(AbstractWriter):
         start1, stop1 = start_indices[0], start_indices[0] + data.shape[0]
         start2, stop2 = start_indices[1], start_indices[1] + data.shape[1]
 
-        # make sure we are using the proper data ordering
-        if not data.flags.c_contiguous:
-            data = numpy.ascontiguousarray(data)
-
         if self._complex_type is False:
             if data.dtype.name != self._data_type.name:
                 raise ValueError(
                     'Writer expects data type {}, and got data of type {}.'.format(self._data_type, data.dtype))
+            # NB: _call handles any necessary data ordering
             self._call(start1, stop1, start2, stop2, data)
         elif callable(self._complex_type):
+            # make sure we are using the proper data ordering
+            if not data.flags.c_contiguous:
+                data = numpy.ascontiguousarray(data)
             new_data = self._complex_type(data)
             if new_data.dtype.name != self._data_type.name:
                 raise ValueError(
@@ -364,9 +835,16 @@ class BIPWriter(AbstractWriter):
                 raise ValueError(
                     'Writer expects data type {}, and got data of type {} from the '
                     'callable method complex_type.'.format(self._data_type, data.dtype))
-            if data.dtype.name != 'complex64':
-                data = data.astype(numpy.complex64)
-
+            if self._memory_map is not None and not \
+                    (data.dtype.name == 'complex64' and data.flags.c_contiguous):
+                # write the components directly, rather than first constructing
+                #   a contiguous complex64 copy
+                self._memory_map[start1:stop1, start2:stop2, 0] = data.real
+                self._memory_map[start1:stop1, start2:stop2, 1] = data.imag
+                return
+
+            # make sure we are using the proper data ordering, a no-op for contiguous complex64
+            data = numpy.ascontiguousarray(data, dtype=numpy.complex64)
             data_view = data.view(numpy.float32).reshape((data.shape[0], data.shape[1], 2))
             self._call(start1, stop1, start2, stop2, data_view)
 
@@ -381,24 +859,49 @@ class BIPWriter(AbstractWriter):
             return
 
         # we have to fall-back to manually write
-        element_size = int_func(self._data_type.itemsize)
-        if len(self._shape) == 3:
-            element_size *= int_func(self._shape[2])
-        stride = element_size*int_func(self._data_size[0])
-        # go to the appropriate spot in the file for first entry
-        self._fid.seek(self._data_offset + stride*start1 + element_size*start2)
-        if start1 == 0 and stop1 == self._data_size[0]:
-            # we can write the block all at once
-            data.astype(self._data_type).tofile(self._fid)
+        stride = self._row_stride
+        # convert the whole block once (usually a no-op), and get the bytes view of each row
+        data = numpy.ascontiguousarray(data, dtype=self._data_type)
+        raw = data.reshape((data.shape[0], -1)).view(numpy.uint8)
+        offset = self._data_offset + stride*start1 + self._element_size*start2
+        if raw.shape[1] == stride:
+            # the rows are contiguous in the file, so we can write the block all at once
+            self._write_at(offset, memoryview(raw.reshape((-1, ))))
         else:
             # have to write one row at a time
-            bytes_to_skip_per_row = element_size*(self._data_size[0]-(stop1-start1))
-            for i, row in enumerate(data):
-                # we the row, and then skip to where the next row starts
-                row.astype(self._data_type).tofile(self._fid)
-                if i < len(data) - 1:
-                    # don't seek on last entry (avoid segfault, or whatever)
-                    self._fid.seek(bytes_to_skip_per_row, os.SEEK_CUR)
+            flat = memoryview(raw.reshape((-1, )))
+            row_bytes = raw.shape[1]
+            for i in range(raw.shape[0]):
+                self._write_at(offset + i*stride, flat[i*row_bytes:(i + 1)*row_bytes])
+
+    def _write_at(self, offset, buffer):
+        """
+        Writes the given buffer to the file, starting at the given offset. This
+        is unbuffered, so there is no intermediate copy of the data.
+
+        Parameters
+        ----------
+        offset : int
+        buffer : memoryview
+            The one-dimensional bytes view to be written.
+
+        Returns
+        -------
+        None
+        """
+
+        start = 0
+        while start < len(buffer):
+            # NB: a single write may write fewer bytes than requested, e.g. more than 2GB
+            if hasattr(os, 'pwrite'):
+                count = os.pwrite(self._fid, buffer[start:], offset + start)
+            else:
+                os.lseek(self._fid, offset + start, os.SEEK_SET)
+                count = os.write(self._fid, buffer[start:])
+            if count == 0:
+                raise IOError(
+                    'Failed writing the expected number of bytes to file {}'.format(self._file_name))
+            start += count
 
     def close(self):
         """
@@ -410,9 +913,9 @@ class BIPWriter(AbstractWriter):
         None
         """
 
-        if hasattr(self, '_fid') and self._fid is not None and \
-                hasattr(self._fid, 'closed') and not self._fid.closed:
-            self._fid.close()
+        if hasattr(self, '_fid') and self._fid is not None:
+            os.close(self._fid)
+            self._fid = None
 
     def __del__(self):
         self.close()
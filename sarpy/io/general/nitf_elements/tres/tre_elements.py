@@ -3,6 +3,7 @@
 Module contained elements for defining TREs - really intended as read only objects.
 """
 
+import struct
 from collections import OrderedDict
 from typing import Union, List
 
@@ -29,7 +30,22 @@ def _parse_type(typ_string, leng, value, start):
     str|int|bytes
     """
 
-    byt = value[start:start + leng]
+    return _parse_bytes(typ_string, value[start:start + leng])
+
+
+def _parse_bytes(typ_string, byt):
+    """
+
+    Parameters
+    ----------
+    typ_string : str
+    byt : bytes
+
+    Returns
+    -------
+    str|int|bytes
+    """
+
     if typ_string == 's':
         return byt.decode('utf-8').strip()
     elif typ_string == 'd':
@@ -52,12 +68,28 @@ def _create_format(typ_string, leng):
 class TREElement(object):
     """
     Basic TRE element class
+
+    An extension consisting only of a fixed schedule of simple fields may declare
+    these at the class level in `_FIELDS`, as a tuple of `(attribute, typ_string, leng)`,
+    in place of calling :meth:`add_field` for each field in its constructor.
     """
 
-    def __init__(self):
+    _FIELDS = None
+
+    def __init__(self, value=None):
+        """
+
+        Parameters
+        ----------
+        value : None|bytes
+            The bytes array from which to deserialize any `_FIELDS`.
+        """
+
         self._field_ordering = []
         self._field_format = {}
         self._bytes_length = 0
+        if self._FIELDS is not None and value is not None:
+            self.add_fixed_fields(value)
 
     def __str__(self):
         return '{0:s}({1:s})'.format(self.__class__.__name__, self.to_dict())
@@ -91,6 +123,54 @@ class TREElement(object):
         self._field_ordering.append(attribute)
         self._field_format[attribute] = _create_format(typ_string, leng)
 
+    @classmethod
+    def _get_fixed_fields(cls):
+        """
+        Gets the parsing details for `_FIELDS`, constructed once per class.
+
+        Returns
+        -------
+        (struct.Struct, tuple, dict)
+            The struct for unpacking all fields, the attribute names, and the
+            attribute formats.
+        """
+
+        fixed = cls.__dict__.get('_FIXED_FIELDS', None)
+        if fixed is None:
+            fixed = (
+                struct.Struct('=' + ''.join('{0:d}s'.format(leng) for _, _, leng in cls._FIELDS)),
+                tuple(attribute for attribute, _, _ in cls._FIELDS),
+                dict((attribute, _create_format(typ_string, leng)) for attribute, typ_string, leng in cls._FIELDS))
+            cls._FIXED_FIELDS = fixed
+        return fixed
+
+    def add_fixed_fields(self, value):
+        """
+        Add all of the fields/attributes declared in `_FIELDS` to the object - as we deserialize.
+
+        Parameters
+        ----------
+        value : bytes
+            The bytes array of the object we are deserializing
+
+        Returns
+        -------
+        None
+        """
+
+        the_struct, attributes, formats = self._get_fixed_fields()
+        try:
+            entries = the_struct.unpack_from(value, self._bytes_length)
+        except struct.error:
+            raise ValueError(
+                '{} requires at least {} bytes, got {}'.format(
+                    self.__class__.__name__, self._bytes_length + the_struct.size, len(value)))
+        for (attribute, typ_string, _), byt in zip(self._FIELDS, entries):
+            setattr(self, attribute, _parse_bytes(typ_string, byt))
+        self._bytes_length += the_struct.size
+        self._field_ordering.extend(attributes)
+        self._field_format.update(formats)
+
     def add_loop(self, attribute, length, child_type, value, *args):
         """
         Add an attribute from a loop construct of a given type to the object - as we deserialize.
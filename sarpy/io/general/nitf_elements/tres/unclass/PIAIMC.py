@@ -7,27 +7,26 @@ __author__ = "Thomas McCullough"
 
 
 class PIAIMCType(TREElement):
-    def __init__(self, value):
-        super(PIAIMCType, self).__init__()
-        self.add_field('CLOUDCVR', 'd', 3, value)
-        self.add_field('SRP', 's', 1, value)
-        self.add_field('SENSMODE', 's', 12, value)
-        self.add_field('SENSNAME', 's', 18, value)
-        self.add_field('SOURCE', 's', 255, value)
-        self.add_field('COMGEN', 'd', 2, value)
-        self.add_field('SUBQUAL', 's', 1, value)
-        self.add_field('PIAMSNNUM', 's', 7, value)
-        self.add_field('CAMSPECS', 's', 32, value)
-        self.add_field('PROJID', 's', 2, value)
-        self.add_field('GENERATION', 'd', 1, value)
-        self.add_field('ESD', 's', 1, value)
-        self.add_field('OTHERCOND', 's', 2, value)
-        self.add_field('MEANGSD', 'd', 7, value)
-        self.add_field('IDATUM', 's', 3, value)
-        self.add_field('IELLIP', 's', 3, value)
-        self.add_field('PREPROC', 's', 2, value)
-        self.add_field('IPROJ', 's', 2, value)
-        self.add_field('SATTRACK', 'd', 8, value)
+    _FIELDS = (
+        ('CLOUDCVR', 'd', 3),
+        ('SRP', 's', 1),
+        ('SENSMODE', 's', 12),
+        ('SENSNAME', 's', 18),
+        ('SOURCE', 's', 255),
+        ('COMGEN', 'd', 2),
+        ('SUBQUAL', 's', 1),
+        ('PIAMSNNUM', 's', 7),
+        ('CAMSPECS', 's', 32),
+        ('PROJID', 's', 2),
+        ('GENERATION', 'd', 1),
+        ('ESD', 's', 1),
+        ('OTHERCOND', 's', 2),
+        ('MEANGSD', 'd', 7),
+        ('IDATUM', 's', 3),
+        ('IELLIP', 's', 3),
+        ('PREPROC', 's', 2),
+        ('IPROJ', 's', 2),
+        ('SATTRACK', 'd', 8))
 
 
 class PIAIMC(TREExtension):
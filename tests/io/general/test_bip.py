@@ -0,0 +1,421 @@
+import os
+import mmap
+import tempfile
+
+import numpy
+
+import sys
+if sys.version_info[0] < 3:
+    # so we can use subtests, which is pretty handy
+    import unittest2 as unittest
+else:
+    import unittest
+
+from sarpy.io.general.base import BaseReader, SubsetChipper
+from sarpy.io.general.bip import BIPChipper, MultiSegmentChipper, BIPWriter
+
+
+class TestBIPChipper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_offset = 37
+        cls.data = numpy.reshape(numpy.arange(7*11*2, dtype='int16'), (7, 11, 2))
+        fi, cls.file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        with open(cls.file_name, 'wb') as fi:
+            fi.write(b'\x00'*cls.data_offset)
+            fi.write(cls.data.tobytes())
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.file_name)
+
+    def _get_file_chipper(self, **kwargs):
+        return BIPChipper(
+            self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset,
+            use_memmap=False, **kwargs)
+
+    def test_read_file(self):
+        chipper = self._get_file_chipper(bands_ip=2)
+        items = [
+            (slice(None), slice(None)),
+            (slice(1, 5), slice(2, 9)),
+            (slice(0, 7, 2), slice(1, 11, 3)),
+            (slice(6, 0, -1), slice(10, 0, -2)),
+            (slice(5, 1, -3), slice(8, 2, -1)),
+            (slice(3, 4), slice(None)),
+        ]
+        for item in items:
+            with self.subTest(msg='slice {}'.format(item)):
+                test_data = chipper[item]
+                self.assertTrue(numpy.all(test_data == self.data[item]))
+
+    def test_read_file_shape(self):
+        # the number of rows and the number of columns read are independent
+        chipper = self._get_file_chipper(bands_ip=2)
+        for item in [(slice(0, 2), slice(None)), (slice(None), slice(3, 5)), (slice(0, 7, 3), slice(10, 0, -4))]:
+            with self.subTest(msg='slice {}'.format(item)):
+                test_data = chipper[item]
+                self.assertEqual(test_data.shape, self.data[item].shape)
+                self.assertTrue(numpy.all(test_data == self.data[item]))
+
+    def test_read_file_complex(self):
+        chipper = self._get_file_chipper(complex_type=True, symmetry=(True, False, True))
+        expected = numpy.swapaxes(self.data[::-1, :, 0] + 1j*self.data[::-1, :, 1], 0, 1)
+        for item in [(slice(None), slice(None)), (slice(2, 9, 3), slice(6, 0, -2))]:
+            with self.subTest(msg='slice {}'.format(item)):
+                test_data = chipper[item]
+                self.assertTrue(numpy.all(test_data == expected[item]))
+
+    def test_read_memory_map(self):
+        chipper = BIPChipper(
+            self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, bands_ip=2, use_memmap=True)
+        file_chipper = self._get_file_chipper(bands_ip=2)
+        for item in [(slice(None), slice(None)), (slice(6, 0, -4), slice(1, 10, 2))]:
+            with self.subTest(msg='slice {}'.format(item)):
+                self.assertTrue(numpy.all(chipper[item] == file_chipper[item]))
+
+    def test_read_memory_map_populate(self):
+        chipper = BIPChipper(
+            self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, bands_ip=2,
+            use_memmap=True, populate=True)
+        for item in [(slice(None), slice(None)), (slice(6, 0, -4), slice(1, 10, 2))]:
+            with self.subTest(msg='slice {}'.format(item)):
+                self.assertTrue(numpy.all(chipper[item] == self.data[item]))
+
+    def test_read_out(self):
+        for use_memmap in [True, False]:
+            chipper = BIPChipper(
+                self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, bands_ip=2,
+                use_memmap=use_memmap)
+            out = numpy.empty((3, 7, 2), dtype='int16')
+            for item in [((1, 4, 1), (2, 9, 1)), ((4, 1, -1), (8, 1, -1))]:
+                with self.subTest(msg='use memmap {}, range {}'.format(use_memmap, item)):
+                    test_data = chipper.read_raw(item[0], item[1], out=out)
+                    self.assertIs(test_data, out)
+                    expected = self.data[slice(*item[0]), slice(*item[1])]
+                    self.assertTrue(numpy.all(test_data == expected))
+            with self.subTest(msg='use memmap {}, incompatible shape'.format(use_memmap)):
+                test_data = chipper.read_raw((0, 2, 1), (2, 9, 1), out=out)
+                self.assertIsNot(test_data, out)
+                self.assertTrue(numpy.all(test_data == self.data[0:2, 2:9]))
+            with self.subTest(msg='use memmap {}, complex type'.format(use_memmap)):
+                complex_chipper = BIPChipper(
+                    self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset,
+                    complex_type=True, use_memmap=use_memmap)
+                test_data = complex_chipper.read_raw((1, 4, 1), (2, 9, 1))
+                self.assertEqual(test_data.dtype, numpy.int16)
+                self.assertTrue(test_data.flags.writeable)
+                self.assertTrue(numpy.all(test_data == self.data[1:4, 2:9]))
+                test_data = complex_chipper.read_raw((4, 1, -1), (8, 1, -1), out=out)
+                self.assertIs(test_data, out)
+                self.assertTrue(numpy.all(test_data == self.data[4:1:-1, 8:1:-1]))
+            with self.subTest(msg='use memmap {}, from reader'.format(use_memmap)):
+                reader = BaseReader(None, chipper)
+                test_data = reader.read_raw((1, 4, 1), (2, 9, 1), out=out)
+                self.assertIs(test_data, out)
+                self.assertTrue(numpy.all(test_data == self.data[1:4, 2:9]))
+
+    def test_read_memory_map_copy(self):
+        chipper = BIPChipper(
+            self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, bands_ip=2, use_memmap=True)
+        with self.subTest(msg='copied by default'):
+            test_data = chipper[1:4, 2:9]
+            self.assertTrue(test_data.flags.writeable)
+            self.assertTrue(numpy.all(test_data == self.data[1:4, 2:9]))
+        with self.subTest(msg='view when requested'):
+            test_data = chipper._read_raw_fun((1, 4, 1), (2, 9, 1), copy=False)
+            self.assertFalse(test_data.flags.owndata)
+            self.assertTrue(numpy.all(test_data == self.data[1:4, 2:9]))
+
+        complex_chipper = BIPChipper(
+            self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, complex_type=True,
+            use_memmap=True)
+        with self.subTest(msg='complex conversion'):
+            test_data = complex_chipper[::2, 3:]
+            expected = self.data[::2, 3:, 0] + 1j*self.data[::2, 3:, 1]
+            self.assertTrue(test_data.flags.writeable)
+            self.assertTrue(numpy.all(test_data == expected))
+        with self.subTest(msg='complex raw data copied by default'):
+            test_data = complex_chipper.read_raw((1, 4, 1), (2, 9, 1))
+            self.assertTrue(test_data.flags.writeable)
+            self.assertTrue(numpy.all(test_data == self.data[1:4, 2:9]))
+
+    def test_invalid_file(self):
+        with self.subTest(msg='missing file'):
+            with self.assertRaises(IOError):
+                BIPChipper(self.file_name + '.missing', 'int16', self.data.shape[:2])
+        with self.subTest(msg='directory'):
+            with self.assertRaises(IOError):
+                BIPChipper(os.path.dirname(self.file_name), 'int16', self.data.shape[:2])
+        with self.subTest(msg='given stat result'):
+            chipper = BIPChipper(
+                self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset,
+                bands_ip=2, stat_result=os.stat(self.file_name))
+            self.assertTrue(numpy.all(chipper[:, :] == self._get_file_chipper(bands_ip=2)[:, :]))
+            with self.assertRaises(IOError):
+                BIPChipper(self.file_name, 'int16', self.data.shape[:2],
+                           stat_result=os.stat(os.path.dirname(self.file_name)))
+
+    def test_should_use_memmap(self):
+        shape = (10000, 4000, 2)
+        with self.subTest(msg='contiguous read'):
+            self.assertTrue(BIPChipper._should_use_memmap((0, 10000, 1), (0, 4000, 1), shape, 4))
+        with self.subTest(msg='sparse columns'):
+            self.assertTrue(BIPChipper._should_use_memmap((0, 10000, 1), (0, 4000, 1000), shape, 4))
+        with self.subTest(msg='narrow tile of a wide image'):
+            self.assertTrue(BIPChipper._should_use_memmap((0, 256, 1), (0, 256, 1), (8000, 8000, 1), 8))
+            self.assertTrue(BIPChipper._should_use_memmap((255, -1, -1), (0, 256, 1), (8000, 8000, 1), 8))
+        with self.subTest(msg='sparse rows'):
+            self.assertFalse(BIPChipper._should_use_memmap((0, 10000, 500), (0, 100, 1), shape, 4))
+        with self.subTest(msg='sparse rows, wide columns'):
+            self.assertTrue(BIPChipper._should_use_memmap((0, 10000, 500), (0, 4000, 1), shape, 4))
+        with self.subTest(msg='default reading'):
+            chipper = BIPChipper(self.file_name, 'int16', self.data.shape[:2], data_offset=self.data_offset, bands_ip=2)
+            self.assertTrue(numpy.all(chipper[::3, 2:5] == self.data[::3, 2:5]))
+
+
+class TestBIPWriter(unittest.TestCase):
+    def setUp(self):
+        self.data_offset = 13
+        fi, self.file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def _get_writer(self, data_size, data_type, complex_type, use_memmap):
+        with open(self.file_name, 'wb') as fi:
+            fi.write(b'\x00'*(self.data_offset + 2*int(numpy.prod(data_size))*numpy.dtype(data_type).itemsize))
+        writer = BIPWriter(self.file_name, data_size, data_type, complex_type, data_offset=self.data_offset)
+        if not use_memmap:
+            # force the manual writing path
+            writer._memory_map = None
+            writer._fid = os.open(self.file_name, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        return writer
+
+    def _read_back(self, data_size, data_type, bands):
+        with open(self.file_name, 'rb') as fi:
+            fi.seek(self.data_offset)
+            data = numpy.fromfile(fi, dtype=data_type, count=int(numpy.prod(data_size))*bands)
+        return numpy.reshape(data, data_size + (bands, ))
+
+    def test_write(self):
+        data = numpy.reshape(numpy.arange(6*9, dtype='int16'), (6, 9))
+        for use_memmap in [True, False]:
+            with self.subTest(msg='use memmap {}'.format(use_memmap)):
+                with self._get_writer(data.shape, '>i2', False, use_memmap) as writer:
+                    writer(data[:2, :], start_indices=(0, 0))
+                    writer(data[2:, :4], start_indices=(2, 0))
+                    writer(data[2:, 4:], start_indices=(2, 4))
+                self.assertTrue(numpy.all(self._read_back(data.shape, '>i2', 1)[:, :, 0] == data))
+
+    def test_write_complex(self):
+        data = numpy.reshape(numpy.arange(5*8, dtype='float32'), (5, 8))*(1 - 2j)
+        for use_memmap in [True, False]:
+            with self.subTest(msg='use memmap {}'.format(use_memmap)):
+                with self._get_writer(data.shape, 'float32', True, use_memmap) as writer:
+                    writer(data[:, :3], start_indices=(0, 0))
+                    writer(data[:, 3:], start_indices=(0, 3))
+                test_data = self._read_back(data.shape, 'float32', 2)
+                self.assertTrue(numpy.all(test_data[:, :, 0] + 1j*test_data[:, :, 1] == data))
+        for use_memmap in [True, False]:
+            with self.subTest(msg='complex128 non-contiguous, use memmap {}'.format(use_memmap)):
+                with self._get_writer(data.shape, '>f4', True, use_memmap) as writer:
+                    writer(numpy.asfortranarray(data, dtype='complex128'), start_indices=(0, 0))
+                test_data = self._read_back(data.shape, '>f4', 2)
+                self.assertTrue(numpy.all(test_data[:, :, 0] + 1j*test_data[:, :, 1] == data))
+
+
+class _ThreadedChipper(MultiSegmentChipper):
+    # force concurrent reading of the child chippers
+    _THREADED_READ_BYTES = 0
+
+
+class TestMultiSegmentChipper(unittest.TestCase):
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(12*10, dtype='float32'), (12, 10))
+        bounds = numpy.array([[0, 5, 0, 4], [0, 5, 4, 10], [5, 12, 0, 4], [5, 12, 4, 10]], dtype='int64')
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        data_offsets = []
+        with open(file_name, 'wb') as fi:
+            for entry in bounds:
+                fi.write(b'\x00'*3)
+                data_offsets.append(fi.tell())
+                fi.write(data[entry[0]:entry[1], entry[2]:entry[3]].tobytes())
+        try:
+            chipper = MultiSegmentChipper(
+                file_name, bounds, numpy.array(data_offsets, dtype='int64'), 'float32',
+                symmetry=(False, False, False))
+            for item in [(slice(None), slice(None)), (slice(2, 10), slice(1, 9)), (slice(6, 9), slice(0, 3))]:
+                with self.subTest(msg='slice {}'.format(item)):
+                    self.assertTrue(numpy.all(chipper[item] == data[item]))
+            with self.subTest(msg='threaded'):
+                threaded_chipper = _ThreadedChipper(
+                    file_name, bounds, numpy.array(data_offsets, dtype='int64'), 'float32',
+                    symmetry=(False, False, False))
+                for item in [(slice(None), slice(None)), (slice(2, 10), slice(1, 9))]:
+                    self.assertTrue(numpy.all(threaded_chipper[item] == data[item]))
+                del threaded_chipper
+            with self.subTest(msg='reuse out'):
+                # NB: the raw data includes the band dimension
+                out = numpy.empty((8, 8, 1), dtype='float32')
+                test_data = chipper.read_raw((2, 10, 1), (1, 9, 1), out=out)
+                self.assertIs(test_data, out)
+                self.assertTrue(numpy.all(test_data[:, :, 0] == data[2:10, 1:9]))
+            with self.subTest(msg='shared memory map'):
+                # noinspection PyProtectedMember
+                mmaps = [child._memory_map._mmap for child in chipper._child_chippers]
+                self.assertTrue(all(entry is mmaps[0] for entry in mmaps))
+            del chipper
+        finally:
+            os.remove(file_name)
+
+    def test_invalid_bounds(self):
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        with open(file_name, 'wb') as fi:
+            fi.write(b'\x00'*200)
+        try:
+            data_offsets = numpy.array([0, 100], dtype='int64')
+            for bounds in [
+                    [[0, 5, 0, 4], [0, 5, 4, 4]],  # empty column range
+                    [[0, 5, 0, 4], [-1, 5, 4, 10]],  # negative row start
+                    [[0, 5, 2, 4], [0, 5, 4, 10]],  # does not start at column 0
+                    [[0, 5, 0, 4], [0, 5, 5, 10]],  # gap between columns
+                    [[0, 5, 0, 4], [5, 10, 4, 10]]]:  # new block of rows not at column 0
+                with self.subTest(msg='bounds {}'.format(bounds)):
+                    with self.assertRaises(ValueError):
+                        MultiSegmentChipper(
+                            file_name, numpy.array(bounds, dtype='int64'), data_offsets, 'uint8',
+                            symmetry=(False, False, False))
+        finally:
+            os.remove(file_name)
+
+    def test_read_raw_complex(self):
+        data = numpy.reshape(numpy.arange(12*10*2, dtype='float32'), (12, 10, 2))
+        bounds = numpy.array([[0, 5, 0, 4], [0, 5, 4, 10], [5, 12, 0, 4], [5, 12, 4, 10]], dtype='int64')
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        data_offsets = []
+        with open(file_name, 'wb') as fi:
+            for entry in bounds:
+                data_offsets.append(fi.tell())
+                fi.write(data[entry[0]:entry[1], entry[2]:entry[3]].tobytes())
+        data_offsets = numpy.array(data_offsets, dtype='int64')
+        try:
+            for chipper_type in [MultiSegmentChipper, _ThreadedChipper]:
+                chipper = chipper_type(
+                    file_name, bounds, data_offsets, 'float32', symmetry=(False, False, False), complex_type=True)
+                with self.subTest(msg='{} complex data'.format(chipper_type.__name__)):
+                    test_data = chipper[2:10, 1:9]
+                    self.assertEqual(test_data.dtype, numpy.complex64)
+                    self.assertTrue(numpy.all(test_data == data[2:10, 1:9, 0] + 1j*data[2:10, 1:9, 1]))
+                with self.subTest(msg='{} raw data'.format(chipper_type.__name__)):
+                    test_data = chipper.read_raw((2, 10, 1), (1, 9, 1))
+                    self.assertEqual(test_data.dtype, numpy.float32)
+                    self.assertTrue(test_data.flags.writeable)
+                    self.assertTrue(numpy.all(test_data == data[2:10, 1:9]))
+                    out = test_data
+                    test_data = chipper.read_raw((3, 11, 1), (2, 10, 1), out=out)
+                    self.assertIs(test_data, out)
+                    self.assertTrue(numpy.all(test_data == data[3:11, 2:10]))
+                with self.subTest(msg='{} subset raw data'.format(chipper_type.__name__)):
+                    subset_chipper = SubsetChipper(chipper, (2, 10), (1, 9))
+                    self.assertTrue(numpy.all(subset_chipper.read_raw((0, 8, 1), (0, 8, 1)) == data[2:10, 1:9]))
+                del chipper
+            with self.subTest(msg='symmetry'):
+                chipper = MultiSegmentChipper(
+                    file_name, bounds, data_offsets, 'float32', symmetry=(True, False, False), complex_type=True)
+                with self.assertRaises(ValueError):
+                    chipper.read_raw(None, None)
+                del chipper
+        finally:
+            os.remove(file_name)
+
+
+class _TiledChipper(BIPChipper):
+    # force tiled copying of memory map reads
+    _TILED_READ_BYTES = 0
+    _TILE_BYTES = 64
+
+
+class _RecordingMmap(object):
+    # records the memory map advice, and otherwise behaves as the given mmap
+    def __init__(self, the_mmap):
+        self.the_mmap = the_mmap
+        self.advice = []
+
+    def madvise(self, advice, start, length):
+        self.advice.append((advice, start, length))
+        return self.the_mmap.madvise(advice, start, length)
+
+
+class TestBIPChipperTiled(unittest.TestCase):
+    def test_tiled_copy(self):
+        data = numpy.reshape(numpy.arange(100*30, dtype='float32'), (100, 30))
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        with open(file_name, 'wb') as fi:
+            fi.write(b'\x00'*5)
+            fi.write(data.tobytes())
+        try:
+            chipper = _TiledChipper(file_name, 'float32', data.shape, data_offset=5, use_memmap=True)
+            for item in [(slice(None), slice(None)), (slice(3, 97), slice(2, 29, 3)), (slice(99, 0, -1), slice(20, 5, -1))]:
+                with self.subTest(msg='slice {}'.format(item)):
+                    self.assertTrue(numpy.all(chipper[item] == data[item]))
+            del chipper
+        finally:
+            os.remove(file_name)
+
+    @unittest.skipIf(not hasattr(mmap, 'MADV_WILLNEED'), 'memory map advice is not available')
+    def test_tiled_copy_prefetch(self):
+        data = numpy.reshape(numpy.arange(100*30, dtype='float32'), (100, 30))
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        with open(file_name, 'wb') as fi:
+            fi.write(data.tobytes())
+        try:
+            chipper = _TiledChipper(file_name, 'float32', data.shape, use_memmap=True)
+            # NB: tiles of a single 120 byte row
+            the_mmap = _RecordingMmap(chipper._memory_map._mmap)
+            chipper._memory_map._mmap = the_mmap
+            with self.subTest(msg='full rows'):
+                self.assertTrue(numpy.all(chipper[:, :] == data))
+                lengths = [entry[2] for entry in the_mmap.advice if entry[0] == mmap.MADV_WILLNEED]
+                self.assertTrue(len(lengths) > 0)
+                self.assertTrue(all(length <= 120 + mmap.PAGESIZE for length in lengths))
+            with self.subTest(msg='narrow column strip'):
+                the_mmap.advice = []
+                self.assertTrue(numpy.all(chipper[:, 0:5] == data[:, 0:5]))
+                self.assertFalse(any(entry[0] == mmap.MADV_WILLNEED for entry in the_mmap.advice))
+            chipper._memory_map._mmap = the_mmap.the_mmap
+            del chipper
+        finally:
+            os.remove(file_name)
+
+    @unittest.skipIf(not hasattr(mmap, 'MADV_WILLNEED'), 'memory map advice is not available')
+    def test_tiled_complex_conversion(self):
+        data = numpy.reshape(numpy.arange(100*30*2, dtype='float32'), (100, 30, 2))
+        expected = data[:, :, 0] + 1j*data[:, :, 1]
+        fi, file_name = tempfile.mkstemp(suffix='.bip')
+        os.close(fi)
+        with open(file_name, 'wb') as fi:
+            fi.write(data.tobytes())
+        try:
+            chipper = _TiledChipper(file_name, 'float32', data.shape[:2], complex_type=True, use_memmap=True)
+            the_mmap = _RecordingMmap(chipper._memory_map._mmap)
+            chipper._memory_map._mmap = the_mmap
+            for item in [(slice(None), slice(None)), (slice(99, 0, -1), slice(2, 29))]:
+                with self.subTest(msg='slice {}'.format(item)):
+                    the_mmap.advice = []
+                    test_data = chipper[item]
+                    self.assertEqual(test_data.dtype, numpy.complex64)
+                    self.assertTrue(test_data.flags.writeable)
+                    self.assertTrue(numpy.all(test_data == expected[item]))
+                    self.assertTrue(any(entry[0] == mmap.MADV_WILLNEED for entry in the_mmap.advice))
+            chipper._memory_map._mmap = the_mmap.the_mmap
+            del chipper
+        finally:
+            os.remove(file_name)
@@ -13,3 +13,24 @@ class TestTreRegistry(unittest.TestCase):
     def test_find_tre(self):
         the_tre = find_tre('ACFTA')
         self.assertEqual(the_tre, ACFTA)
+
+
+class TestTreFixedFields(unittest.TestCase):
+    def test_piaimc(self):
+        from sarpy.io.general.nitf_elements.tres.unclass.PIAIMC import PIAIMC
+        value = b'PIAIMC00362' + \
+            b'050YSPOTLIGHT   SENSORNAME        ' + b'SOURCE'.ljust(255) + \
+            b'01NMISSIO1' + b'SPECS'.ljust(32) + b'XX3NNA0000050WGEWE NNNN12345678'
+        tre = PIAIMC.from_bytes(value, 0)
+        with self.subTest(msg='parsed values'):
+            self.assertEqual(tre.DATA.CLOUDCVR, 50)
+            self.assertEqual(tre.DATA.SENSMODE, 'SPOTLIGHT')
+            self.assertEqual(tre.DATA.SOURCE, 'SOURCE')
+            self.assertEqual(tre.DATA.GENERATION, 3)
+            self.assertEqual(tre.DATA.SATTRACK, 12345678)
+            self.assertEqual(list(tre.DATA.to_dict().keys())[-1], 'SATTRACK')
+        with self.subTest(msg='length'):
+            self.assertEqual(tre.EL, 362)
+        with self.subTest(msg='insufficient length'):
+            with self.assertRaises(ValueError):
+                PIAIMC(value[11:-1])